@@ -1,8 +1,12 @@
 import re
+import string
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List, Set, Union
+from typing import Callable, List, Set, Tuple, Union
 
 from nmk.model.keys import NmkRootConfig
 
@@ -12,23 +16,50 @@ CONFIG_REF_PATTERN = re.compile(r"\$\{([^ \}]+)\}")
 # Pattern to recognize final config items
 FINAL_ITEM_PATTERN = re.compile("^[A-Z0-9_]+$")
 
+# Characters allowed in final config items names (same as above pattern)
+_FINAL_CHARS = frozenset(string.ascii_uppercase + string.digits + "_")
 
-@dataclass
+# Slotted dataclasses options (only supported from python 3.10)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Sentinel for values not resolved yet
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _split_ref(ref: str) -> Tuple[str, Tuple[str, ...]]:
+    # Handle doted references (for dicts)
+    if "." in ref:
+        segments = ref.split(".")
+        return segments[0], tuple(segments[1:])
+    return ref, None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NmkConfig(ABC):
     name: str
     model: object
     path: Path
+    _is_final: bool = field(init=False, default=None, repr=False, compare=False)
+    cached_value: object = field(init=False, default=_MISSING, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Intern name, as it is massively used as dict key and set member while resolving
+        self.name = sys.intern(self.name)
 
     @property
     def is_final(self) -> bool:
-        return FINAL_ITEM_PATTERN.match(self.name) is not None
+        # Name never changes: check it only once
+        if self._is_final is None:
+            self._is_final = len(self.name) > 0 and _FINAL_CHARS.issuperset(self.name)
+        return self._is_final
 
     @property
     def value(self) -> Union[str, int, bool, list, dict]:
         return self.resolve()
 
     def resolve(self, cache: bool = True, resolved_from: Set[str] = None) -> Union[str, int, bool, list, dict]:
-        if not cache or not hasattr(self, "cached_value") or self.cached_value is None:
+        if not cache or self.cached_value is _MISSING:
             # Get value from implementation
             out = self._get_value(cache, resolved_from)
 
@@ -44,62 +75,87 @@ class NmkConfig(ABC):
     def _format(
         self, cache: bool, candidate: Union[str, int, bool, list, dict], resolved_from: Set[str] = None, path: Path = None
     ) -> Union[str, int, bool, list, dict]:
-        resolved_from = set(resolved_from) if resolved_from is not None else set()
-        resolved_from.add(self.name)
+        # Push this config on the (shared) resolution stack, if not already there
+        if resolved_from is None:
+            resolved_from = set()
+        added = self.name not in resolved_from
+        if added:
+            resolved_from.add(self.name)
+        try:
+            return self._format_tree(cache, candidate, resolved_from, path)
+        finally:
+            # Pop it once formatted
+            if added:
+                resolved_from.discard(self.name)
+
+    def _format_tree(self, cache: bool, candidate: Union[str, int, bool, list, dict], resolved_from: Set[str], path: Path) -> Union[str, int, bool, list, dict]:
+        # Exact type checks (values come from yml/json loaders or resolvers, i.e. builtin types)
+        t = type(candidate)
+        if t is str:
+            return self._format_scalar(cache, candidate, resolved_from, path)
 
         # Map dicts and lists
-        if isinstance(candidate, list):
-            return [self._format(cache, c, resolved_from, path) for c in candidate]
-        if isinstance(candidate, dict):
-            return {k: self._format(cache, v, resolved_from, path) for k, v in candidate.items()}
-        if not isinstance(candidate, str):
-            # Nothing to format
+        if t is list:
+            return [self._format_tree(cache, c, resolved_from, path) for c in candidate]
+        if t is dict:
+            return {k: self._format_tree(cache, v, resolved_from, path) for k, v in candidate.items()}
+
+        # Nothing to format
+        return candidate
+
+    def _format_scalar(self, cache: bool, candidate: str, resolved_from: Set[str], path: Path) -> Union[str, int, bool, list, dict]:
+        if "${" not in candidate:
+            # No reference in this string
             return candidate
 
-        # Iterate on <xxx> references
-        m = True
-        to_format = candidate
-        while m is not None:
-            m = CONFIG_REF_PATTERN.search(to_format)
-            if m is not None:
-                # Look for referenced config item name
-                ref_name = m.group(1)
-                if ref_name == NmkRootConfig.BASE_DIR:
-                    # Resolve current path
-                    ref_value = str(path if path is not None else self.path)
-                else:
-                    # Handle doted references (for dicts)
-                    if "." in ref_name:
-                        segments = ref_name.split(".")
-                        ref_name = segments[0]
-                    else:
-                        segments = None
-
-                    # Resolve from config
-                    assert ref_name not in resolved_from, f"Cyclic string substitution: resolving (again!) '{ref_name}' config from '{self.name}' config"
-                    assert ref_name in self.model.config, f"Unknown '{ref_name}' config referenced from '{self.name}' config"
-
-                    # Resolve reference
-                    ref_value = self.model.config[ref_name].resolve(cache, resolved_from)
-
-                    # Doted reference?
-                    if segments is not None:
-                        # Iterate on segments as long as we get dicts
-                        v = ref_value
-                        for segment in segments[1:]:
-                            assert isinstance(v, dict), f"Doted reference from {self.name} used for {ref_name} value, which is not a dict"
-                            assert len(segment), f"Empty doted reference segment from {self.name} for {ref_name} value"
-                            assert segment in v, f"Unknown dict key {segment} in doted reference from {self.name} for {ref_name} value"
-                            v = v[segment]
-                        ref_value = v
-
-                # Replace with resolved value
-                begin, end = m.span(0)
-                if m.group(0) == to_format and not isinstance(ref_value, str):
-                    # Stop here, with raw non-string value
-                    return ref_value
-                to_format = to_format[0:begin] + str(ref_value) + to_format[end:]
-        return to_format
+        # Local aliases for the references resolution loop
+        _cfg = self.model.config
+        _base = NmkRootConfig.BASE_DIR
+        _pat = CONFIG_REF_PATTERN
+        _name = self.name
+
+        def resolve_ref(ref_name: str) -> Union[str, int, bool, list, dict]:
+            # Look for referenced config item name
+            if ref_name == _base:
+                # Resolve current path
+                return str(path if path is not None else self.path)
+
+            # Handle doted references (for dicts)
+            ref_name, segments = _split_ref(ref_name)
+
+            # Resolve from config
+            assert ref_name not in resolved_from, f"Cyclic string substitution: resolving (again!) '{ref_name}' config from '{_name}' config"
+            assert ref_name in _cfg, f"Unknown '{ref_name}' config referenced from '{_name}' config"
+
+            # Resolve reference
+            ref_value = _cfg[ref_name].resolve(cache, resolved_from)
+
+            # Doted reference?
+            if segments is not None:
+                # Iterate on segments as long as we get dicts
+                for segment in segments:
+                    assert isinstance(ref_value, dict), f"Doted reference from {_name} used for {ref_name} value, which is not a dict"
+                    assert len(segment), f"Empty doted reference segment from {_name} for {ref_name} value"
+                    assert segment in ref_value, f"Unknown dict key {segment} in doted reference from {_name} for {ref_name} value"
+                    ref_value = ref_value[segment]
+            return ref_value
+
+        # Whole string is a single reference?
+        m = _pat.fullmatch(candidate)
+        if m is not None:
+            # Stop here, with raw (possibly non-string) value
+            return resolve_ref(m.group(1))
+
+        # Iterate on <xxx> references, in a single pass
+        parts = []
+        last = 0
+        for m in _pat.finditer(candidate):
+            begin, end = m.span(0)
+            parts.append(candidate[last:begin])
+            parts.append(str(resolve_ref(m.group(1))))
+            last = end
+        parts.append(candidate[last:])
+        return "".join(parts)
 
     @abstractmethod
     def _get_value(self, cache: bool, resolved_from: Set[str] = None) -> Union[str, int, bool, list, dict]:  # pragma: no cover
@@ -111,7 +167,7 @@ class NmkConfig(ABC):
         pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkStaticConfig(NmkConfig):
     static_value: Union[str, int, bool, list, dict]
 
@@ -124,13 +180,14 @@ class NmkStaticConfig(NmkConfig):
         return type(self.static_value)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkResolvedConfig(NmkConfig):
     resolver: Callable
+    _declared_type: object = field(init=False, default=_MISSING, repr=False, compare=False)
 
     def resolve(self, cache: bool = True, resolved_from: Set[str] = None) -> Union[str, int, bool, list, dict]:
         # Always disable cache if resolver is volatile
-        return super().resolve(cache and not self.resolver.is_volatile(self.name), resolved_from)
+        return super(NmkResolvedConfig, self).resolve(cache and not self.resolver.is_volatile(self.name), resolved_from)
 
     def _get_value(self, cache: bool, resolved_from: Set[str] = None) -> Union[str, int, bool, list, dict]:
         try:
@@ -148,53 +205,69 @@ class NmkResolvedConfig(NmkConfig):
     @property
     def value_type(self) -> object:
         try:
-            # Ask resolver for value type
-            return self.resolver.get_type(self.name)
+            # Ask resolver for value type (only once: declared type can't change, even for volatile values)
+            if self._declared_type is _MISSING:
+                self._declared_type = self.resolver.get_type(self.name)
+            return self._declared_type
         except Exception as e:
             raise Exception(f"Error occurred while getting type for config {self.name}: {e}").with_traceback(e.__traceback__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkMergedConfig(NmkConfig):
     static_list: List[NmkStaticConfig] = field(default_factory=list)
 
-    # Recursive list resolution
-    def traverse_list(self, items: list, out_list: list, cache: bool, resolved_from: Set[str], holder):
-        for item in items:
-            formatted_item = self._format(cache, item, resolved_from, path=holder.path)
-            if isinstance(formatted_item, list):
-                # Go deeper in this sub-list
-                self.traverse_list(formatted_item, out_list, cache, resolved_from, holder)
-            else:
+    # Iterative list merge (items are already formatted by their holder)
+    def traverse_list(self, items: list, out_list: list):
+        # Stack of pending (sub-)lists iterators
+        stack = deque([iter(items)])
+        while stack:
+            for item in stack[-1]:
+                if type(item) is list:
+                    # Go deeper in this sub-list
+                    stack.append(iter(item))
+                    break
+
                 # Simple list append
-                out_list.append(formatted_item)
-
-    # Recursive dict resolution
-    def traverse_dict(self, items: dict, out_dict: dict, cache: bool, resolved_from: Set[str], holder):
-        for k, v in items.items():
-            formatted_item = self._format(cache, v, resolved_from, path=holder.path)
-            if isinstance(formatted_item, dict):
-                # Recursively merge this dict
-                if k not in out_dict:
-                    out_dict[k] = {}
-                self.traverse_dict(formatted_item, out_dict[k], cache, resolved_from, holder)
-            elif isinstance(formatted_item, list):
-                # Recursively merge this list
-                if k not in out_dict:
-                    out_dict[k] = []
-                self.traverse_list(formatted_item, out_dict[k], cache, resolved_from, holder)
+                out_list.append(item)
+            else:
+                # This (sub-)list is done
+                stack.pop()
+
+    # Iterative dict merge (items are already formatted by their holder)
+    def traverse_dict(self, items: dict, out_dict: dict):
+        # Stack of pending (sub-)dicts iterators, with their output dict
+        stack = deque([(iter(items.items()), out_dict)])
+        while stack:
+            pending, out = stack[-1]
+            for k, formatted_item in pending:
+                t = type(formatted_item)
+                if t is dict:
+                    # Go deeper to merge this dict
+                    if k not in out:
+                        out[k] = {}
+                    stack.append((iter(formatted_item.items()), out[k]))
+                    break
+                elif t is list:
+                    # Merge this list
+                    if k not in out:
+                        out[k] = []
+                    self.traverse_list(formatted_item, out[k])
+                else:
+                    # Simple item: override
+                    out[k] = formatted_item
             else:
-                # Simple item: override
-                out_dict[k] = formatted_item
+                # This (sub-)dict is done
+                stack.pop()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkListConfig(NmkMergedConfig):
     def _get_value(self, cache: bool, resolved_from: Set[str] = None) -> list:
         # Merge lists (recursively)
         out = []
         for holder in self.static_list:
-            self.traverse_list(holder._get_value(cache), out, cache, resolved_from, holder)
+            self.traverse_list(holder._get_value(cache, resolved_from), out)
         return out
 
     @property
@@ -202,13 +275,13 @@ class NmkListConfig(NmkMergedConfig):
         return list
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkDictConfig(NmkMergedConfig):
     def _get_value(self, cache: bool, resolved_from: Set[str] = None) -> dict:
         # Merge dicts and lists (recursively)
         out = {}
         for holder in self.static_list:
-            self.traverse_dict(holder._get_value(cache), out, cache, resolved_from, holder)
+            self.traverse_dict(holder._get_value(cache, resolved_from), out)
         return out
 
     @property
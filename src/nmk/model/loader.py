@@ -1,6 +1,5 @@
 import json
 import os
-import re
 import shutil
 import sys
 from argparse import Namespace
@@ -14,9 +13,6 @@ from nmk.model.files import NmkModelFile
 from nmk.model.keys import NmkRootConfig
 from nmk.model.model import NmkModel
 
-# Config pattern
-CONFIG_STRING_PATTERN = re.compile("^([^ =]+)=(.*)$")
-
 
 class NmkLoader:
     def __init__(self, args: Namespace, with_logs: bool = True):
@@ -51,7 +47,7 @@ class NmkLoader:
             NmkRootConfig.PROJECT_DIR: "",  # Will be updated as soon as initial project is loaded
             NmkRootConfig.PROJECT_NMK_DIR: "",  # Will be updated as soon as initial project is loaded
             NmkRootConfig.PROJECT_FILES: [],  # Will be updated as soon as files are loaded
-            NmkRootConfig.ENV: {k: v for k, v in os.environ.items()},
+            NmkRootConfig.ENV: dict(os.environ),
         }.items():
             self.model.add_config(name, None, value)
 
@@ -60,10 +56,11 @@ class NmkLoader:
 
         # Refresh project files list
         NmkLogger.debug(f"Updating {NmkRootConfig.PROJECT_FILES} now that all files are loaded")
-        self.model.config[NmkRootConfig.PROJECT_FILES] = NmkStaticConfig(NmkRootConfig.PROJECT_FILES, self.model, None, list(self.model.files.keys()))
+        self.model.config[NmkRootConfig.PROJECT_FILES] = NmkStaticConfig(NmkRootConfig.PROJECT_FILES, self.model, None, list(self.model.files))
 
     def override_config(self, config_list: List[str]):
         # Iterate on config
+        overrides = []
         for config_str in config_list:
             override_config = {}
 
@@ -77,15 +74,19 @@ class NmkLoader:
 
             # Single config string?
             else:
-                m = CONFIG_STRING_PATTERN.match(config_str)
-                assert m is not None, f"Config option is neither a json object nor a K=V string: {config_str}"
-                override_config = {m.group(1): m.group(2)}
+                k, sep, v = config_str.partition("=")
+                assert sep and len(k) and " " not in k, f"Config option is neither a json object nor a K=V string: {config_str}"
+                override_config = {k: v}
 
-            # Override model config with command-line values
+            # Remember command-line values (keep all of them, in order: lists and dicts may be merged)
             if len(override_config):
                 NmkLogger.debug(f"Overriding config from --config option ({config_str})")
-                for k, v in override_config.items():
-                    self.model.add_config(k, None, v)
+                overrides.extend(override_config.items())
+
+        # Override model config with command-line values
+        add_config = self.model.add_config
+        for k, v in overrides:
+            add_config(k, None, v)
 
     def finish_parsing(self, args: Namespace, with_logs: bool):
         # Handle root folder
@@ -109,8 +110,11 @@ class NmkLoader:
             logging_setup(args)
 
     def validate_tasks(self):
-        # Iterate on tasks
-        for task in self.model.tasks.values():
-            # Resolve references
+        # Resolve all tasks references first (each task exactly once)...
+        tasks = self.model.tasks.values()
+        for task in tasks:
             task._resolve_subtasks()
+
+        # ... then contribute to other tasks dependencies (all already resolved)
+        for task in tasks:
             task._resolve_contribs()
@@ -37,6 +37,9 @@ class NmkModel:
     def add_config(
         self, name: str, path: Path, init_value: Union[str, int, bool, list, dict] = None, resolver: object = None, task_config: bool = False
     ) -> NmkConfig:
+        # Interned name (shared with config object, for fast dict lookups)
+        name = sys.intern(name)
+
         # Real value?
         is_list = is_dict = False
         if init_value is not None:
@@ -1,14 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Union
+from typing import List, Set, Union
 
 from rich.emoji import Emoji
 from rich.text import Text
 
-from nmk.model.config import NmkConfig, NmkDictConfig, NmkListConfig
+from nmk.model.config import DATACLASS_SLOTS, NmkConfig, NmkDictConfig, NmkListConfig
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NmkTask:
     name: str
     description: str
@@ -27,26 +27,34 @@ class NmkTask:
     subtasks: List[object] = None
     _inputs: List[Path] = None
     _outputs: List[Path] = None
+    _deps_set: Set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Side index of dependencies names, for fast lookup
+        self._deps_set = set(self._deps)
 
     def __resolve_task(self, name: Union[str, List[str]]) -> object:
         if name is not None:
             # Iterate on candidate names until we find a known one
             name_list = name if isinstance(name, list) else [name]
+            tasks = self.model.tasks
             for name_candidate in name_list:
-                if name_candidate in self.model.tasks:
-                    return self.model.tasks[name_candidate]
+                t = tasks.get(name_candidate)
+                if t is not None:
+                    return t
             else:
                 raise AssertionError(f"Can't find any of candidates ({name_list}) referenced by {self.name} task")
         return None
 
     def __contribute_dep(self, name: Union[str, List[str]], append: bool):
         t = self.__resolve_task(name)
-        if t is not None and self.name not in t._deps:
+        if t is not None and self.name not in t._deps_set:
             # Ascendant dependency which is not yet contributed:
             # - first resolve (if not done yet)
             t._resolve_subtasks()
 
             # - then add to list
+            t._deps_set.add(self.name)
             if append:
                 t._deps.append(self.name)
                 t.subtasks.append(self)
@@ -58,7 +66,8 @@ class NmkTask:
         # Resolved yet?
         if self.subtasks is None:
             # Map names to
-            self.subtasks = list(filter(lambda t: t is not None, map(self.__resolve_task, self._deps)))
+            resolve = self.__resolve_task
+            self.subtasks = [t for t in (resolve(n) for n in self._deps) if t is not None]
         return self.subtasks
 
     def _resolve_contribs(self):
@@ -72,9 +81,12 @@ class NmkTask:
             path_config = getattr(self, field + "_cfg")
             paths = []
             if path_config is not None:
+                # Remove duplicates (keeping order)
+                seen = set()
                 for new_path in path_config.value:
                     new_p = Path(new_path)
-                    if new_p not in paths:
+                    if new_p not in seen:
+                        seen.add(new_p)
                         paths.append(new_p)
             setattr(self, field, paths)
         return getattr(self, field)
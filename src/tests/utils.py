@@ -2,8 +2,11 @@ from pathlib import Path
 
 from nmk.tests.tester import NmkBaseTester
 
+# Templates folder for all tests
+TEMPLATES_ROOT = Path(__file__).parent / "templates"
+
 
 class NmkTester(NmkBaseTester):
     @property
     def templates_root(self) -> Path:
-        return Path(__file__).parent / "templates"
+        return TEMPLATES_ROOT